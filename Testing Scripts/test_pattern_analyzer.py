@@ -1,6 +1,20 @@
+import heapq
+import sys
+
 from data_loader import list_matches
 from pattern_analyzer import build_all_matches_dangers_for_patterns, find_patterns
 
+
+def _format_pattern(p) -> str:
+    return (
+        f"{p.count} | base= {p.baseline_count}"
+        f" | goals_prev= {p.prevalence_goals} | all_prev= {p.prevalence_all}"
+        f" | lift= {p.lift} | conf= {p.confidence}"
+        f" | combo: {' + '.join(p.code_combo)}\n"
+        f"examples: {p.matches[:5]}\n"
+    )
+
+
 def main():
     matches = list_matches()
 
@@ -12,32 +26,13 @@ def main():
     goal_dangers = build_all_matches_dangers_for_patterns(matches, mode="goals")
     print("Goal danger moments:", len(goal_dangers))
 
-    patterns = find_patterns(
-        goal_dangers,
-        baseline_dangers=baseline,
-        min_subseq_similarity=0.85,
-        min_match_frequency=2,
-        min_occurrences=3,
-        min_lift=1.15,
-    )
+    patterns = find_patterns(goal_dangers, baseline_dangers=baseline)
 
     print("Patterns found:", len(patterns))
-    for p in patterns[:10]:
-        print(
-            p["frequency"],
-            "| occ=", p["occurrences"],
-            "| goals=", p["goals_in_pattern"],
-            "| goal_rate=", p["pattern_goal_rate"],
-            "| base=", p["baseline_goal_rate"],
-            "| lift=", p["lift"],
-            "| conf=", p["confidence_score"], f"({p['confidence_tier']})",
-            "| p>", p["p_goal_rate_gt_baseline"],
-            "| CI90=[", p["ci90_low"], ",", p["ci90_high"], "]",
-            "| seq:", " → ".join(p["sequence"]),
-        )
-
-        print("examples:", p["example_matches"])
-        print()
+    # Only the top 10 are shown, so pick them without sorting the whole list
+    top = heapq.nlargest(10, patterns, key=lambda p: p.confidence if p.confidence is not None else -1)
+    sys.stdout.write("\n".join(_format_pattern(p) for p in top))
+    sys.stdout.flush()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
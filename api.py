@@ -148,16 +148,18 @@ def get_risk(index: int):
     offset_sec, h2_start_sec = _get_halftime_info(events_df)
 
     # Downsample to every 3rd second for chart performance
+    times = risk_df["time_s"].to_numpy()[::3].tolist()
+    scores = risk_df["risk_score"].to_numpy()[::3].tolist()
+
     timeline = []
-    for i in range(0, len(risk_df), 3):
-        row = risk_df.iloc[i]
-        raw_sec = int(row["time_s"])
+    for t, score in zip(times, scores):
+        raw_sec = int(t)
         display_sec = _apply_offset(raw_sec, offset_sec, h2_start_sec)
         timeline.append({
             "time_sec": raw_sec,
             "display_sec": display_sec,
             "match_minute": round(display_sec / 60.0, 2),
-            "risk_score": float(row["risk_score"]),
+            "risk_score": float(score),
         })
 
     return {
@@ -273,9 +275,9 @@ def analyze_window(index: int, req: WindowRequest):
     opponent = _extract_opponent(events_df)
 
     # Filter events overlapping with the requested window
-    events_cleaned = events_df.dropna(subset=["timestamp", "end_timestamp"]).copy()
-    events_cleaned["start_sec"] = events_cleaned["timestamp"].dt.total_seconds().astype(int)
-    events_cleaned["end_sec"] = np.ceil(events_cleaned["end_timestamp"].dt.total_seconds()).astype(int)
+    events_cleaned = events_df.dropna(subset=["start_s", "end_s"]).copy()
+    events_cleaned["start_sec"] = events_cleaned["start_s"].astype(int)
+    events_cleaned["end_sec"] = np.ceil(events_cleaned["end_s"]).astype(int)
 
     in_window = events_cleaned[
         (events_cleaned["end_sec"] >= req.start_sec) &
@@ -58,14 +58,15 @@ def detect_danger_moments(
     if risk_df is None or risk_df.empty:
         return []
 
-    df = risk_df.copy()
-
     # Defensive: ensure columns exist
-    if "time_s" not in df.columns or "risk_score" not in df.columns:
+    if "time_s" not in risk_df.columns or "risk_score" not in risk_df.columns:
         return []
 
-    df["time_s"] = pd.to_numeric(df["time_s"], errors="coerce")
-    df["risk_score"] = pd.to_numeric(df["risk_score"], errors="coerce")
+    # assign() leaves the caller's frame untouched without a full up-front copy
+    df = risk_df.assign(
+        time_s=pd.to_numeric(risk_df["time_s"], errors="coerce"),
+        risk_score=pd.to_numeric(risk_df["risk_score"], errors="coerce"),
+    )
     df = df[np.isfinite(df["time_s"]) & np.isfinite(df["risk_score"])].sort_values("time_s").reset_index(drop=True)
     if df.empty:
         return []
@@ -78,24 +79,16 @@ def detect_danger_moments(
     if not above.any():
         return []
 
-    segments = []
-    start_idx = None
-    for i, is_above in enumerate(above):
-        if is_above and start_idx is None:
-            start_idx = i
-        if (not is_above) and start_idx is not None:
-            segments.append((start_idx, i - 1))
-            start_idx = None
-    if start_idx is not None:
-        segments.append((start_idx, len(df) - 1))
+    # Runs of the mask start where the padded diff goes 0->1 and end where it goes 1->0
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], above, [False])).astype(np.int8)))
+    seg_start, seg_end = edges[::2], edges[1::2] - 1
 
     # Convert segments to windows + merge close ones
-    windows = []
-    for a, b in segments:
-        t0, t1 = float(times[a]), float(times[b])
-        if (t1 - t0) < min_duration_s:
-            continue
-        windows.append([t0, t1])
+    long_enough = (times[seg_end] - times[seg_start]) >= min_duration_s
+    windows = [
+        [t0, t1]
+        for t0, t1 in zip(times[seg_start[long_enough]].tolist(), times[seg_end[long_enough]].tolist())
+    ]
 
     # Merge windows that are close
     merged = []
@@ -108,22 +101,26 @@ def detect_danger_moments(
         else:
             merged.append(w)
 
+    # Plain column arrays: positions here are also the reset index labels
+    active_col = df["active_event_codes"].to_numpy() if "active_event_codes" in df.columns else None
+
     out: List[Dict[str, Any]] = []
     for t0, t1 in merged:
-        mask = (df["time_s"] >= t0) & (df["time_s"] <= t1)
-        chunk = df.loc[mask]
-        if chunk.empty:
+        # times is sorted, so the window [t0, t1] is a contiguous index range
+        lo = int(np.searchsorted(times, t0, side="left"))
+        hi = int(np.searchsorted(times, t1, side="right"))
+        if hi <= lo:
             continue
 
-        peak_idx = int(chunk["risk_score"].idxmax())
-        peak_s = float(df.loc[peak_idx, "time_s"])
-        peak_score = float(df.loc[peak_idx, "risk_score"])
+        peak_idx = lo + int(np.argmax(scores[lo:hi]))
+        peak_s = float(times[peak_idx])
+        peak_score = float(scores[peak_idx])
         severity = _severity_from_score(peak_score)
 
         # Active event codes at peak, if available
         active_codes: List[str] = []
-        if "active_event_codes" in df.columns:
-            val = df.loc[peak_idx, "active_event_codes"]
+        if active_col is not None:
+            val = active_col[peak_idx]
             if isinstance(val, list):
                 active_codes = [str(x) for x in val]
             elif pd.notna(val):
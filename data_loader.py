@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import glob
+import hashlib
 import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -13,6 +14,10 @@ from pathlib import Path
 
 
 MATCHES_DIR = Path("matches")
+EVENTS_CACHE_DIR = Path("cache/events")
+
+# Bump whenever load_events' output changes so stale cached frames are ignored
+EVENTS_CACHE_VERSION = 3
 
 
 def get_halftime_offset(events_df: pd.DataFrame) -> pd.Timedelta:
@@ -63,17 +68,51 @@ def _find_pattern_xml(match_dir: Path) -> Optional[Path]:
     return Path(candidates[0])
 
 
+def _events_cache_path(pattern_path: Path) -> Path:
+    """
+    Cache file for a parsed *_pattern.xml, keyed on the file's identity
+    (path, mtime, size) and EVENTS_CACHE_VERSION.
+    """
+    st = pattern_path.stat()
+    raw = (
+        f"v={EVENTS_CACHE_VERSION}||path={pattern_path.resolve()}"
+        f"||mtime={st.st_mtime_ns}||size={st.st_size}"
+    )
+    key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    return EVENTS_CACHE_DIR / f"{key}.pkl"
+
+
+def _read_events_cache(path: Path) -> Optional[pd.DataFrame]:
+    if not path.exists():
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+
+def _write_events_cache(path: Path, df: pd.DataFrame) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write-then-rename so parallel loaders never read a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_pickle(tmp)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
 def load_events(match_name: str, matches_dir: Path = MATCHES_DIR) -> pd.DataFrame:
     """
     Loads events from the match's *_pattern.xml.
 
     Output columns (minimum needed by the rest of your pipeline):
       - match
-      - code
-      - team
+      - code (categorical)
+      - team (categorical)
       - timestamp   (pd.Timedelta)
       - end_timestamp (pd.Timedelta)
-      - start_s, end_s (float seconds)
+      - start_s, end_s, duration_s (float seconds)
       - half (optional string if present)
     """
     match_dir = matches_dir / match_name
@@ -84,10 +123,21 @@ def load_events(match_name: str, matches_dir: Path = MATCHES_DIR) -> pd.DataFram
     if pattern_path is None:
         raise FileNotFoundError(f"Missing *_pattern.xml in: {match_dir}")
 
+    # Parsed events are static per XML file: reuse them across runs
+    cache_path = _events_cache_path(pattern_path)
+    cached = _read_events_cache(cache_path)
+    if cached is not None:
+        return cached
+
     tree = ET.parse(pattern_path)
     root = tree.getroot()
 
-    rows: list[dict] = []
+    # Collect columns directly (one list per field) instead of a dict per row
+    codes: list[str] = []
+    teams: list[str] = []
+    halves: list[Optional[str]] = []
+    starts: list[float] = []
+    ends: list[float] = []
 
     # The file structure you showed uses <instance> ... </instance>
     for inst in root.iter():
@@ -138,24 +188,34 @@ def load_events(match_name: str, matches_dir: Path = MATCHES_DIR) -> pd.DataFram
         if start_s is None or end_s is None or code is None:
             continue
 
-        rows.append(
-            {
-                "match_name": match_name,
-                "code": code,
-                "Team": team or "N/A",
-                "Half": half,
-                "start_s": float(start_s),
-                "end_s": float(end_s),
-                "timestamp": pd.to_timedelta(start_s, unit="s"),
-                "end_timestamp": pd.to_timedelta(end_s, unit="s"),
-            }
-        )
-
-    df = pd.DataFrame(rows)
+        codes.append(code)
+        teams.append(team or "N/A")
+        halves.append(half)
+        starts.append(float(start_s))
+        ends.append(float(end_s))
+
+    df = pd.DataFrame(
+        {
+            "match_name": match_name,
+            # Few distinct values over many rows: categoricals make == / isin masks
+            # compare small integer codes instead of walking Python strings
+            "code": pd.Categorical(codes),
+            "Team": pd.Categorical(teams),
+            "Half": halves,
+            "start_s": starts,
+            "end_s": ends,
+        }
+    )
+    # Vectorized conversion, once per column
+    df["timestamp"] = pd.to_timedelta(df["start_s"], unit="s")
+    df["end_timestamp"] = pd.to_timedelta(df["end_s"], unit="s")
+    # exact (integer ns) difference, not end_s - start_s in float
+    df["duration_s"] = (df["end_timestamp"] - df["timestamp"]).dt.total_seconds()
     if df.empty:
         raise ValueError(f"No <instance> events parsed from: {pattern_path}")
 
     df = df.sort_values("timestamp").reset_index(drop=True)
+    _write_events_cache(cache_path, df)
     return df
 
 def get_halftime_offset(events_df: pd.DataFrame) -> pd.Timedelta:
@@ -1,8 +1,13 @@
 # explainer.py
 from __future__ import annotations
 
+import asyncio
+import atexit
+import concurrent.futures
+import functools
 import json
 import os
+import random
 import re
 import hashlib
 import time
@@ -11,7 +16,15 @@ from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 load_dotenv()
 
@@ -28,8 +41,9 @@ class LLMConfig:
     model: str
     base_url: str = "https://openrouter.ai/api/v1"
     timeout_sec: int = 60
-    max_retries: int = 3
+    max_retries: int = 6
     retry_backoff_sec: float = 1.5
+    retry_max_sec: float = 60.0
 
 def _load_config() -> LLMConfig:
     api_key = os.environ.get("OPENROUTER_API_KEY")
@@ -39,8 +53,18 @@ def _load_config() -> LLMConfig:
     model = os.environ.get("OPENROUTER_MODEL", DEFAULT_MODEL)
     return LLMConfig(api_key=api_key, model=model)
 
+@functools.lru_cache(maxsize=1)
 def _get_client(cfg: LLMConfig) -> OpenAI:
-    return OpenAI(base_url=cfg.base_url, api_key=cfg.api_key)
+    # One client per config, reused across calls so its HTTP connection pool
+    # (keep-alive, TLS sessions) survives between requests.
+    client = OpenAI(base_url=cfg.base_url, api_key=cfg.api_key, max_retries=0)
+    atexit.register(client.close)
+    return client
+
+def _get_async_client(cfg: LLMConfig) -> AsyncOpenAI:
+    # Not cached: an async client's pool is bound to the event loop it runs on,
+    # so callers (call_llm_batch) open one per loop and close it when done.
+    return AsyncOpenAI(base_url=cfg.base_url, api_key=cfg.api_key, max_retries=0)
 
 # -------------------------
 # Output hard-constraints
@@ -431,14 +455,42 @@ def _save_cache(key: str, prompt: str, response: str, model: str) -> None:
 # LLM calls
 # -------------------------
 
-def call_llm(prompt: str, system_prompt: Optional[str] = None) -> str:
-    cfg = _load_config()
-    client = _get_client(cfg)
+# Only these are worth retrying (429s, 5xx, timeouts, dropped connections, plus
+# 408/409 like the SDK's own retry policy); anything else (bad key, bad request)
+# fails straight away.
+_TRANSIENT_ERRORS = (RateLimitError, InternalServerError, APITimeoutError, APIConnectionError)
+_TRANSIENT_STATUS = (408, 409)
 
+def _is_transient(err: Exception) -> bool:
+    if isinstance(err, _TRANSIENT_ERRORS):
+        return True
+    return isinstance(err, APIStatusError) and (err.status_code in _TRANSIENT_STATUS or err.status_code >= 500)
+
+def _retry_delay(cfg: LLMConfig, attempt: int, err: Exception) -> float:
+    """
+    Seconds to wait before the next attempt: the server's Retry-After if it
+    sent one, else exponential backoff with jitter, capped at retry_max_sec.
+    """
+    response = getattr(err, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(cfg.retry_max_sec, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return min(cfg.retry_max_sec, cfg.retry_backoff_sec * (2 ** attempt) + random.uniform(0.0, 1.0))
+
+def _build_messages(prompt: str, system_prompt: Optional[str]) -> list[dict]:
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
+    return messages
+
+def call_llm(prompt: str, system_prompt: Optional[str] = None) -> str:
+    cfg = _load_config()
+    client = _get_client(cfg)
+    messages = _build_messages(prompt, system_prompt)
 
     last_err: Optional[Exception] = None
     for attempt in range(cfg.max_retries):
@@ -451,14 +503,75 @@ def call_llm(prompt: str, system_prompt: Optional[str] = None) -> str:
             text = resp.choices[0].message.content or ""
             return text
         except Exception as e:
+            if not _is_transient(e) or attempt >= cfg.max_retries - 1:
+                raise
             last_err = e
-            if attempt < cfg.max_retries - 1:
-                time.sleep(cfg.retry_backoff_sec * (attempt + 1))
-            else:
+            time.sleep(_retry_delay(cfg, attempt, e))
+
+    raise RuntimeError(f"LLM call failed: {last_err}")
+
+async def acall_llm(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    *,
+    client: Optional[AsyncOpenAI] = None,
+) -> str:
+    """
+    Async variant of call_llm. Pass `client` to share one connection pool
+    across many concurrent calls (see call_llm_batch).
+    """
+    cfg = _load_config()
+    if client is None:
+        # One-off call: open (and close) a client just for it
+        async with _get_async_client(cfg) as own_client:
+            return await acall_llm(prompt, system_prompt, client=own_client)
+    messages = _build_messages(prompt, system_prompt)
+
+    last_err: Optional[Exception] = None
+    for attempt in range(cfg.max_retries):
+        try:
+            resp = await client.chat.completions.create(
+                model=cfg.model,
+                messages=messages,
+                timeout=cfg.timeout_sec,
+            )
+            return resp.choices[0].message.content or ""
+        except Exception as e:
+            if not _is_transient(e) or attempt >= cfg.max_retries - 1:
                 raise
+            last_err = e
+            await asyncio.sleep(_retry_delay(cfg, attempt, e))
 
     raise RuntimeError(f"LLM call failed: {last_err}")
 
+async def call_llm_batch(
+    prompts: list[str],
+    system_prompt: Optional[str] = None,
+    *,
+    concurrency: int = 20,
+    return_exceptions: bool = False,
+) -> list:
+    """
+    Run many prompts concurrently (at most `concurrency` in flight) over one
+    async client. Results are returned in the order of `prompts`; with
+    return_exceptions=True a failed prompt yields its exception instead of raising.
+    """
+    cfg = _load_config()
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async with _get_async_client(cfg) as client:
+        async def _one(prompt: str) -> str:
+            async with sem:
+                return await acall_llm(prompt, system_prompt, client=client)
+
+        return await asyncio.gather(*(_one(p) for p in prompts), return_exceptions=return_exceptions)
+
+def _clean_response(raw: str, postprocess_fn=None) -> str:
+    # No postprocessor (e.g. explain_window): keep the text, just trimmed
+    if postprocess_fn is None:
+        return (raw or "").strip()
+    return postprocess_fn(raw)
+
 def call_llm_cached(
     prompt: str,
     system_prompt: Optional[str] = None,
@@ -474,16 +587,66 @@ def call_llm_cached(
 
     try:
         raw = call_llm(prompt, system_prompt)
-        if postprocess_fn is None:
-            cleaned = _postprocess_llm(raw)
-        else:
-            cleaned = postprocess_fn(raw)
+        cleaned = _clean_response(raw, postprocess_fn)
     except Exception as e:
         cleaned = f"[Explanation unavailable: {e}]"
 
     _save_cache(key, prompt, cleaned, cfg.model)
     return cleaned
 
+def _run_sync(coro):
+    """
+    asyncio.run(coro), also from code that already has a running event loop
+    (Jupyter, async handlers): there it runs on a private loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+def call_llm_cached_batch(
+    prompts: list[str],
+    system_prompt: Optional[str] = None,
+    *,
+    postprocess_fn=None,
+    concurrency: int = 20,
+) -> list[str]:
+    """
+    Batch version of call_llm_cached: cache hits are served from disk and
+    only the misses are sent to the API, concurrently.
+    """
+    if not prompts:
+        return []
+
+    cfg = _load_config()
+    keys = [_cache_key(p, system_prompt, cfg.model) for p in prompts]
+    results: list[Optional[str]] = [_get_cached(k) for k in keys]
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    if missing:
+        raws = _run_sync(
+            call_llm_batch(
+                [prompts[i] for i in missing],
+                system_prompt,
+                concurrency=concurrency,
+                return_exceptions=True,
+            )
+        )
+        for i, raw in zip(missing, raws):
+            try:
+                if isinstance(raw, BaseException):
+                    raise raw
+                cleaned = _clean_response(raw, postprocess_fn)
+            except Exception as e:
+                cleaned = f"[Explanation unavailable: {e}]"
+
+            _save_cache(keys[i], prompts[i], cleaned, cfg.model)
+            results[i] = cleaned
+
+    return results
+
 # -------------------------
 # Public API
 # -------------------------
@@ -519,6 +682,30 @@ def explain_pattern(pattern: dict) -> str:
     prompt = build_pattern_prompt(pattern)
     return call_llm_cached(prompt, system_prompt=SYSTEM_PROMPT_PATTERN, postprocess_fn=_postprocess_pattern)
 
+def explain_moments(moments: list[dict], *, concurrency: int = 20) -> list[str]:
+    """
+    Concurrent explain_moment over many moments. Each item holds the
+    explain_moment keyword arguments (danger_moment, match_name, opponent,
+    tracking_summary).
+    """
+    prompts = [build_moment_prompt(**m) for m in moments]
+    return call_llm_cached_batch(
+        prompts,
+        system_prompt=SYSTEM_PROMPT_MOMENT,
+        postprocess_fn=_postprocess_moment,
+        concurrency=concurrency,
+    )
+
+def explain_patterns(patterns: list[dict], *, concurrency: int = 20) -> list[str]:
+    """Concurrent explain_pattern over many patterns."""
+    prompts = [build_pattern_prompt(p) for p in patterns]
+    return call_llm_cached_batch(
+        prompts,
+        system_prompt=SYSTEM_PROMPT_PATTERN,
+        postprocess_fn=_postprocess_pattern,
+        concurrency=concurrency,
+    )
+
 if __name__ == "__main__":
     cfg = _load_config()
     print(f"Model: {cfg.model}")
@@ -8,15 +8,14 @@ import math
 from pathlib import Path
 from typing import Optional
 
-from data_loader import list_matches, load_events
-from risk_engine import compute_risk_score
-from danger_detector import detect_danger_moments
+from data_loader import list_matches
 from pattern_analyzer import (
-    build_all_matches_dangers_for_patterns,
+    dangers_for_patterns,
+    detect_dangers_per_match,
     find_patterns,
     format_patterns_for_llm,
 )
-from explainer import explain_moment, explain_pattern
+from explainer import explain_moments, explain_patterns
 from tracking_features import summarize_window, load_team_map
 
 
@@ -155,7 +154,7 @@ def infer_opponent(match_name: str, barca_tokens: tuple[str, ...] = ("Barça", "
     return clean_team(left)
 
 
-def main(limit_matches: Optional[int], limit_dangers: Optional[int], top_n_patterns: int):
+def main(limit_matches: Optional[int], limit_dangers: Optional[int], top_n_patterns: int, n_jobs: int = -1):
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     matches = list_matches()
@@ -167,20 +166,13 @@ def main(limit_matches: Optional[int], limit_dangers: Optional[int], top_n_patte
     # -------------------------
     all_moment_outputs = []
 
-    for match_name in matches:
-        events_df = load_events(match_name)
-        risk_df = compute_risk_score(events_df)
+    # Matches are independent and CPU-bound, so score them in parallel up front
+    dangers_per_match = detect_dangers_per_match(matches, workers=n_jobs)
 
+    for match_name, dangers in zip(matches, dangers_per_match):
         opponent = infer_opponent(match_name)
         player_df, ball_df, team_map = load_tracking_frames(match_name)
 
-        dangers = detect_danger_moments(
-            risk_df,
-            events_df,
-            debug=False,
-            match_name=match_name,
-        )
-
         if limit_dangers is not None:
             dangers = dangers[:limit_dangers]
 
@@ -209,17 +201,30 @@ def main(limit_matches: Optional[int], limit_dangers: Optional[int], top_n_patte
                     attacking_team_id=str((team_map or {}).get("opponent_team_id")) if (team_map or {}).get("opponent_team_id") is not None else None,
                 )
 
-            text = explain_moment(d, match_name, opponent, tracking_summary=tracking_summary)
             all_moment_outputs.append(
                 {
                     "match_name": match_name,
                     "opponent": opponent,
                     "danger_moment": d,
                     "tracking_summary": tracking_summary,
-                    "llm_response": text,
                 }
             )
 
+    # LLM calls are network-bound: send them concurrently in one batch
+    texts = explain_moments(
+        [
+            {
+                "danger_moment": o["danger_moment"],
+                "match_name": o["match_name"],
+                "opponent": o["opponent"],
+                "tracking_summary": o["tracking_summary"],
+            }
+            for o in all_moment_outputs
+        ]
+    )
+    for o, text in zip(all_moment_outputs, texts):
+        o["llm_response"] = text
+
     clean_moments = _nan_to_none(all_moment_outputs)
 
     (OUT_DIR / "danger_moment_explanations.json").write_text(
@@ -230,16 +235,15 @@ def main(limit_matches: Optional[int], limit_dangers: Optional[int], top_n_patte
     # -------------------------
     # B) Cross-match patterns -> LLM explanations
     # -------------------------
-    baseline = build_all_matches_dangers_for_patterns(matches, mode="all")
-    goal_dangers = build_all_matches_dangers_for_patterns(matches, mode="goals")
+    # Reuse the dangers detected in A instead of reloading and rescoring every match twice
+    baseline = dangers_for_patterns(matches, dangers_per_match, mode="all")
+    goal_dangers = dangers_for_patterns(matches, dangers_per_match, mode="goals")
 
     patterns = find_patterns(goal_dangers, baseline_dangers=baseline)
     patterns_for_llm = format_patterns_for_llm(patterns, top_n=top_n_patterns)
 
-    pattern_outputs = []
-    for p in patterns_for_llm:
-        text = explain_pattern(p)
-        pattern_outputs.append({"pattern": p, "llm_response": text})
+    texts = explain_patterns(patterns_for_llm)
+    pattern_outputs = [{"pattern": p, "llm_response": text} for p, text in zip(patterns_for_llm, texts)]
 
     clean_patterns = _nan_to_none(pattern_outputs)
 
@@ -256,6 +260,7 @@ if __name__ == "__main__":
     parser.add_argument("--limit_matches", type=int, default=None, help="Process only first N matches")
     parser.add_argument("--limit_dangers", type=int, default=None, help="Explain only first N dangers per match")
     parser.add_argument("--top_n_patterns", type=int, default=10, help="Top N patterns to explain")
+    parser.add_argument("--n_jobs", type=int, default=-1, help="Worker processes for match scoring (-1 = all cores)")
     args = parser.parse_args()
 
-    main(args.limit_matches, args.limit_dangers, args.top_n_patterns)
\ No newline at end of file
+    main(args.limit_matches, args.limit_dangers, args.top_n_patterns, args.n_jobs)
\ No newline at end of file
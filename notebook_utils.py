@@ -11,27 +11,29 @@ from IPython.display import display
 from data_loader import get_halftime_offset
 
 
+def _fmt_mmss(seconds) -> list[str]:
+    """Format seconds as m:ss strings (whole seconds, truncated like int())."""
+    secs = np.asarray(seconds, dtype=float).astype(np.int64)
+    mins, rem = np.divmod(secs, 60)
+    return [f"{m}:{sec:02d}" for m, sec in zip(mins.tolist(), rem.tolist())]
+
+
 # -- Event code distribution ------------------------------------------------
 
 def show_event_code_distribution(events_df: pd.DataFrame) -> None:
     """Bar chart of event code counts by team, sorted by total count descending."""
-    barca    = events_df[events_df["Team"] == "FC Barcelona"]
-    opponent = events_df[(events_df["Team"] != "FC Barcelona") & (events_df["Team"] != "N/A")]
-    codes    = sorted(events_df["code"].dropna().unique())
-
-    totals       = {c: 0 for c in codes}
-    barca_counts = {}
-    opp_counts   = {}
-    for c in codes:
-        b = len(barca[barca["code"] == c])
-        o = len(opponent[opponent["code"] == c])
-        barca_counts[c] = b
-        opp_counts[c]   = o
-        totals[c]       = b + o
-
-    codes = sorted(codes, key=lambda c: totals[c], reverse=True)
-    b_vals = [barca_counts[c] for c in codes]
-    o_vals = [opp_counts[c]   for c in codes]
+    team = events_df["Team"]
+    side = np.where(team == "FC Barcelona", "barca", np.where(team == "N/A", "neutral", "opp"))
+    counts = (
+        pd.crosstab(events_df["code"], side)
+        .reindex(columns=["barca", "opp"], fill_value=0)
+    )
+    totals = counts["barca"] + counts["opp"]
+    counts = counts.loc[totals.sort_values(ascending=False, kind="stable").index]
+
+    codes  = list(counts.index)
+    b_vals = counts["barca"].tolist()
+    o_vals = counts["opp"].tolist()
 
     x     = np.arange(len(codes))
     width = 0.4
@@ -53,22 +55,14 @@ def show_event_code_distribution(events_df: pd.DataFrame) -> None:
 def show_tag_overlap_examples(events_df: pd.DataFrame, minute: float = 10) -> None:
     """Show all events active at a given match minute."""
     target_sec = minute * 60
-    clean = events_df.dropna(subset=["timestamp", "end_timestamp"]).copy()
-    clean["start_sec"]    = clean["timestamp"].dt.total_seconds()
-    clean["end_sec"]      = clean["end_timestamp"].dt.total_seconds()
-    clean["duration_sec"] = clean["end_sec"] - clean["start_sec"]
-
-    active = clean[
-        (clean["start_sec"] <= target_sec) & (clean["end_sec"] >= target_sec)
-    ].copy()
-
-    def fmt(s):
-        m, sec = divmod(int(s), 60)
-        return f"{m}:{sec:02d}"
-
-    active["Start"]    = active["start_sec"].apply(fmt)
-    active["End"]      = active["end_sec"].apply(fmt)
-    active["Duration"] = active["duration_sec"].apply(lambda s: f"{s:.0f}s")
+    # NaN bounds never satisfy the comparisons, so no dropna/copy of the full frame is needed
+    active = events_df[
+        (events_df["start_s"] <= target_sec) & (events_df["end_s"] >= target_sec)
+    ].assign(
+        Start=lambda d: _fmt_mmss(d["start_s"]),
+        End=lambda d: _fmt_mmss(d["end_s"]),
+        Duration=lambda d: [f"{s:.0f}s" for s in d["duration_s"].tolist()],
+    )
 
     print(f"Events active at minute {minute:.1f} - {len(active)} overlapping tags:\n")
     cols = ["code", "Team", "Start", "End", "Duration", "Type", "Side"]
@@ -82,25 +76,24 @@ def show_duration_stats(events_df: pd.DataFrame) -> None:
     Table of duration statistics per event code: mean, median, std, min, max (seconds).
     Sorted by median ascending so short events appear first.
     """
-    clean = events_df.dropna(subset=["timestamp", "end_timestamp"]).copy()
-    clean["duration_sec"] = (
-        clean["end_timestamp"] - clean["timestamp"]
-    ).dt.total_seconds()
-
-    rows = []
-    for code, grp in clean.groupby("code"):
-        d = grp["duration_sec"].dropna()
-        rows.append({
-            "Event Code": code,
-            "Count":      len(d),
-            "Mean (s)":   round(d.mean(), 1),
-            "Median (s)": round(d.median(), 1),
-            "Std (s)":    round(d.std(), 1),
-            "Min (s)":    round(d.min(), 1),
-            "Max (s)":    round(d.max(), 1),
+    clean = events_df.dropna(subset=["start_s", "end_s"])
+
+    df = (
+        clean.groupby("code", observed=True, sort=False)["duration_s"]
+        .agg(["count", "mean", "median", "std", "min", "max"])
+        .round(1)
+        .reset_index()
+        .rename(columns={
+            "code":   "Event Code",
+            "count":  "Count",
+            "mean":   "Mean (s)",
+            "median": "Median (s)",
+            "std":    "Std (s)",
+            "min":    "Min (s)",
+            "max":    "Max (s)",
         })
-
-    df = pd.DataFrame(rows).sort_values("Median (s)")
+        .sort_values(["Median (s)", "Event Code"])
+    )
     display(df.reset_index(drop=True))
 
 
@@ -113,25 +106,19 @@ def show_time_offset_demonstration(events_df: pd.DataFrame, n_rows: int = 10) ->
     """
     offset     = get_halftime_offset(events_df)
     offset_sec = int(offset.total_seconds())
-    h2         = events_df[events_df["Half"] == "2nd Half"].copy()
-    h2_start   = int(h2["timestamp"].dt.total_seconds().min()) if not h2.empty else 99999
-
-    def fmt(td, correct=False):
-        s = int(td.total_seconds())
-        if correct and s >= h2_start:
-            s -= offset_sec
-        m, sec = divmod(s, 60)
-        return f"{m}:{sec:02d}"
+    h2_ts      = events_df.loc[events_df["Half"] == "2nd Half", "timestamp"]
+    h2_start   = int(h2_ts.dt.total_seconds().min()) if not h2_ts.empty else 99999
 
-    clean   = events_df.dropna(subset=["timestamp"]).copy()
+    clean   = events_df.dropna(subset=["timestamp"])
     h1_samp = clean[clean["Half"] == "1st Half"].head(n_rows // 2)
     h2_samp = clean[clean["Half"] == "2nd Half"].head(n_rows // 2)
     sample  = pd.concat([h1_samp, h2_samp]).sort_values("timestamp")
 
-    sample["Raw video time"]      = sample["timestamp"].apply(lambda td: fmt(td, correct=False))
-    sample["Corrected game time"] = sample["timestamp"].apply(lambda td: fmt(td, correct=True))
-    sample["Offset applied"]      = sample["Half"].apply(
-        lambda h: f"-{offset_sec}s ({offset_sec // 60}m {offset_sec % 60}s)" if h == "2nd Half" else "none"
+    secs = sample["timestamp"].dt.total_seconds().to_numpy().astype(np.int64)
+    sample["Raw video time"]      = _fmt_mmss(secs)
+    sample["Corrected game time"] = _fmt_mmss(np.where(secs >= h2_start, secs - offset_sec, secs))
+    sample["Offset applied"]      = np.where(
+        sample["Half"] == "2nd Half", f"-{offset_sec}s ({offset_sec // 60}m {offset_sec % 60}s)", "none"
     )
 
     print(f"Halftime offset detected: {offset_sec} seconds ({offset_sec / 60:.1f} minutes)\n")
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from joblib import Parallel, delayed
+
 from data_loader import load_events
 from danger_detector import detect_danger_moments
 from risk_engine import BARCA_EVENT_WEIGHTS, OPPONENT_EVENT_WEIGHTS, compute_risk_score
@@ -12,7 +14,7 @@ OPPONENT_WEIGHTS = OPPONENT_EVENT_WEIGHTS
 BARCA_WEIGHTS = BARCA_EVENT_WEIGHTS
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     code_combo: tuple[str, ...]
     # number of matches in the *target* set (e.g., goal_dangers) where this combo appears
@@ -28,31 +30,77 @@ class Pattern:
 
 
 
-def build_all_matches_dangers_for_patterns(matches: list[str], mode: str = "all") -> list[dict[str, Any]]:
+def detect_match_dangers(match_name: str) -> list[dict[str, Any]]:
+    """
+    Load one match, score it and detect its danger moments.
+    Kept at module level so joblib workers can pickle it.
+    """
+    events_df = load_events(match_name)
+    risk_df = compute_risk_score(events_df)
+    return detect_danger_moments(risk_df, events_df, match_name=match_name, debug=False)
+
+
+def detect_dangers_per_match(matches: list[str], *, workers: Optional[int] = None) -> list[list[dict[str, Any]]]:
+    """
+    detect_match_dangers for every match, one list per match (aligned with `matches`).
+
+    workers:
+      - None: process matches serially (default)
+      - otherwise: joblib n_jobs for processing matches in parallel (-1 = all cores);
+        output order is the same as the serial path
+    """
+    if workers is None:
+        return [detect_match_dangers(match_name) for match_name in matches]
+    return Parallel(n_jobs=workers, backend="loky")(
+        delayed(detect_match_dangers)(match_name) for match_name in matches
+    )
+
+
+def _select_match_dangers(match_name: str, dangers: list[dict[str, Any]], mode: str = "all") -> list[dict[str, Any]]:
+    # If your upstream adds outcomes (goals/shot), filter here.
+    if mode == "goals":
+        gd = [d for d in dangers if str(d.get("outcome", "")).lower() in ("goal", "scored", "conceded_goal")]
+        dangers = gd if gd else dangers
+
+    out: list[dict[str, Any]] = []
+    for d in dangers:
+        d2 = dict(d)
+        d2["match_name"] = match_name
+        out.append(d2)
+    return out
+
+
+def build_all_matches_dangers_for_patterns(
+    matches: list[str],
+    mode: str = "all",
+    *,
+    workers: Optional[int] = None,
+) -> list[dict[str, Any]]:
     """
     Builds a flat list of danger moments across matches.
 
     mode:
       - "all": include all detected danger moments
       - "goals": only those with outcome == goal (if present), else falls back to all
-    """
-    all_dangers: list[dict[str, Any]] = []
-    for match_name in matches:
-        events_df = load_events(match_name)
-        risk_df = compute_risk_score(events_df)
 
-        dangers = detect_danger_moments(risk_df, events_df, match_name=match_name, debug=False)
-
-        # If your upstream adds outcomes (goals/shot), filter here.
-        if mode == "goals":
-            gd = [d for d in dangers if str(d.get("outcome", "")).lower() in ("goal", "scored", "conceded_goal")]
-            dangers = gd if gd else dangers
+    workers: see detect_dangers_per_match.
+    """
+    return dangers_for_patterns(matches, detect_dangers_per_match(matches, workers=workers), mode)
 
-        for d in dangers:
-            d2 = dict(d)
-            d2["match_name"] = match_name
-            all_dangers.append(d2)
 
+def dangers_for_patterns(
+    matches: list[str],
+    dangers_per_match: list[list[dict[str, Any]]],
+    mode: str = "all",
+) -> list[dict[str, Any]]:
+    """
+    Same output as build_all_matches_dangers_for_patterns, but from danger moments
+    the caller already detected (one list per match, aligned with `matches`), so
+    no match is reloaded or rescored.
+    """
+    all_dangers: list[dict[str, Any]] = []
+    for match_name, dangers in zip(matches, dangers_per_match):
+        all_dangers.extend(_select_match_dangers(match_name, dangers, mode))
     return all_dangers
 
 
@@ -62,19 +110,39 @@ def _danger_signature(d: dict[str, Any]) -> tuple[str, ...]:
     Treat pattern as an unordered combo of the key active event codes.
     """
     codes = d.get("active_event_codes") or []
-    codes = [str(c).strip() for c in codes if str(c).strip()]
-
-    # de-dup
-    seen = set()
-    uniq = []
-    for c in codes:
-        if c not in seen:
-            uniq.append(c)
-            seen.add(c)
 
+    # The combo is sorted, so first-seen order is irrelevant: de-dup with a set
+    uniq = {s for s in (str(c).strip() for c in codes) if s}
     return tuple(sorted(uniq))
 
 
+def _index_combos(dangers: list[dict[str, Any]]) -> tuple[dict[tuple[str, ...], int], list[str]]:
+    """
+    One pass over dangers: signature -> bitset of the (non-empty) match names it appears in.
+    Bit i stands for the i-th name of the returned match list.
+    """
+    combo_to_bits: dict[tuple[str, ...], int] = {}
+    match_bit: dict[str, int] = {}
+    for d in dangers:
+        mn = str(d.get("match_name", ""))
+        if not mn:
+            continue
+        bit = match_bit.setdefault(mn, 1 << len(match_bit))
+        combo = _danger_signature(d)
+        if combo:
+            combo_to_bits[combo] = combo_to_bits.get(combo, 0) | bit
+    return combo_to_bits, list(match_bit)
+
+
+def _bits_to_names(bits: int, names: list[str]) -> list[str]:
+    out: list[str] = []
+    while bits:
+        low = bits & -bits
+        out.append(names[low.bit_length() - 1])
+        bits ^= low
+    return out
+
+
 def find_patterns(dangers: list[dict[str, Any]], *, baseline_dangers: Optional[list[dict[str, Any]]] = None) -> list[Pattern]:
     """
     Counts repeated combos of active event codes across matches.
@@ -90,41 +158,19 @@ def find_patterns(dangers: list[dict[str, Any]], *, baseline_dangers: Optional[l
         return []
 
     # Target set (e.g., goal dangers)
-    combo_to_matches: dict[tuple[str, ...], set[str]] = {}
-    target_matches: set[str] = set()
-    for d in dangers:
-        mn = str(d.get("match_name", ""))
-        if mn:
-            target_matches.add(mn)
-        combo = _danger_signature(d)
-        if not combo:
-            continue
-        combo_to_matches.setdefault(combo, set()).add(mn)
-
+    combo_to_bits, target_matches = _index_combos(dangers)
     total_target_matches = max(1, len(target_matches))
 
     # Baseline set (e.g., all dangers)
-    baseline_combo_to_matches: dict[tuple[str, ...], set[str]] = {}
-    baseline_matches: set[str] = set()
-    if baseline_dangers:
-        for d in baseline_dangers:
-            mn = str(d.get("match_name", ""))
-            if mn:
-                baseline_matches.add(mn)
-            combo = _danger_signature(d)
-            if not combo:
-                continue
-            baseline_combo_to_matches.setdefault(combo, set()).add(mn)
-
+    baseline_combo_to_bits, baseline_matches = _index_combos(baseline_dangers or [])
     total_baseline_matches = max(1, len(baseline_matches)) if baseline_matches else None
 
     patterns: list[Pattern] = []
-    for combo, ms in combo_to_matches.items():
-        p = Pattern(code_combo=combo, count=len([x for x in ms if x]), matches=sorted([x for x in ms if x]))
+    for combo, bits in combo_to_bits.items():
+        p = Pattern(code_combo=combo, count=bits.bit_count(), matches=sorted(_bits_to_names(bits, target_matches)))
 
-        if baseline_combo_to_matches and total_baseline_matches:
-            b_ms = baseline_combo_to_matches.get(combo, set())
-            p.baseline_count = len([x for x in b_ms if x])
+        if baseline_combo_to_bits and total_baseline_matches:
+            p.baseline_count = baseline_combo_to_bits.get(combo, 0).bit_count()
 
             p.prevalence_goals = p.count / float(total_target_matches)
             p.prevalence_all = p.baseline_count / float(total_baseline_matches)
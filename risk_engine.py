@@ -1,6 +1,8 @@
 # risk_engine.py
 from __future__ import annotations
 
+import functools
+import heapq
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
@@ -219,32 +221,57 @@ def _compute_raw_scores(
     # Pre-extract arrays for speed
     starts = events_cleaned["Start"].to_numpy(dtype=float)
     ends = events_cleaned["End"].to_numpy(dtype=float)
-    codes = events_cleaned["Code"].astype(str).to_numpy()
-    teams = events_cleaned["Team"].astype(str).to_numpy()
-
-    def weight_for(code: str, team: str) -> float:
-        # "N/A" team means neutral (e.g. kickoff), treat as small/no effect
-        if team == "N/A":
-            return 0.0
-        if team.lower() in ("fc barcelona", "barça", "barca"):
-            return float(barca_weights.get(code, 0.0))
-        return float(opponent_weights.get(code, 0.0))
-
-    # For each event, add its weight over its active interval
-    for s, e, c, tm in zip(starts, ends, codes, teams):
-        if not np.isfinite(s) or not np.isfinite(e) or e <= s:
-            continue
-        w = weight_for(c, tm)
-        if w == 0.0:
-            continue
-
-        mask = (time_grid >= s) & (time_grid <= e)
-        raw[mask] += w
-
-        # Track active event codes for debugging/explanations
-        idxs = np.where(mask)[0]
-        for i in idxs:
-            active[i].append(c)
+
+    # Resolve weights once per distinct code, then index them per event as
+    # integers instead of dispatching on the code/team strings of every row.
+    code_idx, uniq_codes = pd.factorize(events_cleaned["Code"].astype(str))
+    uniq_codes = np.asarray(uniq_codes, dtype=object)
+    codes = uniq_codes[code_idx]
+    opp_w = np.array([float(opponent_weights.get(c, 0.0)) for c in uniq_codes], dtype=float)
+    barca_w = np.array([float(barca_weights.get(c, 0.0)) for c in uniq_codes], dtype=float)
+
+    teams = events_cleaned["Team"].astype(str)
+    # "N/A" team means neutral (e.g. kickoff), treat as small/no effect
+    is_neutral = (teams == "N/A").to_numpy()
+    is_barca = teams.str.lower().isin(("fc barcelona", "barça", "barca")).to_numpy()
+
+    weights = np.where(is_barca, barca_w[code_idx], opp_w[code_idx])
+    weights[is_neutral] = 0.0
+    keep = np.isfinite(starts) & np.isfinite(ends) & (ends > starts) & (weights != 0.0)
+
+    # The grid is sorted, so each event's active span [s, e] maps to a grid
+    # index range [lo, hi) with two binary searches instead of a full-grid mask.
+    lo = np.searchsorted(time_grid, starts[keep], side="left")
+    hi = np.searchsorted(time_grid, ends[keep], side="right")
+    w = weights[keep]
+
+    # Add each event's weight over its slice, in event order. A difference array
+    # + cumsum would be O(grid) too, but leaves ~1e-16 residue where +w/-w pairs
+    # cancel; per-slice adds give exactly the sums of the old masked loop.
+    for a, b, wk in zip(lo.tolist(), hi.tolist(), w.tolist()):
+        raw[a:b] += wk
+
+    # Track active event codes for debugging/explanations.
+    # Sweep the grid once: an event enters the active set at `lo` and leaves at
+    # `hi` (min-heap keyed on `hi`). The set only changes at those boundaries, so
+    # every grid point between two boundaries shares the same (read-only) list.
+    # Enter events in `lo` order (stable argsort: input order is left as it is,
+    # so sums and list order match a plain event-by-event loop).
+    kept_codes = codes[keep]
+    order = np.argsort(lo, kind="stable")
+    bounds = np.unique(np.concatenate([lo, hi, [0, len(time_grid)]]))
+    heap: List[Tuple[int, int]] = []
+    j = 0
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        while j < len(order) and lo[order[j]] <= a:
+            k = int(order[j])
+            heapq.heappush(heap, (int(hi[k]), k))
+            j += 1
+        while heap and heap[0][0] <= a:
+            heapq.heappop(heap)
+        # keep the original event order within each list
+        codes_now = [kept_codes[k] for k in sorted(k for _, k in heap)]
+        active[a:b] = [codes_now] * int(b - a)
 
     return raw, active
 
@@ -256,6 +283,20 @@ def _smooth(x: np.ndarray, window_n: int) -> np.ndarray:
     return np.convolve(x, w, mode="same")
 
 
+@functools.lru_cache(maxsize=None)
+def _absolute_scale_max(top_k: int = 6) -> float:
+    """
+    Raw score that maps to 100: sum of the top_k opponent and top_k Barça weights.
+    Depends only on the module-level weight tables, so it is computed once per process.
+    """
+    opp_top = heapq.nlargest(top_k, (float(v) for v in OPPONENT_EVENT_WEIGHTS.values()))
+    bar_top = heapq.nlargest(top_k, (float(v) for v in BARCA_EVENT_WEIGHTS.values()))
+    abs_max = float(sum(opp_top) + sum(bar_top))
+    if not np.isfinite(abs_max) or abs_max <= 1e-9:
+        abs_max = 1.0
+    return abs_max
+
+
 def compute_risk_score(events_df: pd.DataFrame, config: RiskConfig = RiskConfig()) -> pd.DataFrame:
     """
     Build a continuous risk score over time from pattern events.
@@ -307,12 +348,7 @@ def compute_risk_score(events_df: pd.DataFrame, config: RiskConfig = RiskConfig(
     # -----------------------------
     # 3) ABSOLUTE scaling (no per-match normalization)
     # -----------------------------
-    TOP_K = 6
-    opp_top = sorted([float(v) for v in OPPONENT_EVENT_WEIGHTS.values()], reverse=True)[:TOP_K]
-    bar_top = sorted([float(v) for v in BARCA_EVENT_WEIGHTS.values()], reverse=True)[:TOP_K]
-    abs_max = float(sum(opp_top) + sum(bar_top))
-    if not np.isfinite(abs_max) or abs_max <= 1e-9:
-        abs_max = 1.0
+    abs_max = _absolute_scale_max()
 
     raw_pos = np.clip(raw_smooth, 0.0, None)
     scaled = (raw_pos / abs_max) * 100.0
@@ -328,8 +364,10 @@ def compute_risk_score(events_df: pd.DataFrame, config: RiskConfig = RiskConfig(
     BARCA_NAMES = {"fc barcelona", "barcelona", "barça", "fcb"}
 
     if events_cleaned is not None and not events_cleaned.empty and len(time_grid):
-        codes = events_cleaned["Code"].astype(str).str.lower()
-        is_goal_code = codes.apply(lambda s: any(k in s for k in GOAL_CODE_KEYWORDS))
+        # Classify each distinct code/team label once, then broadcast by index
+        code_idx, uniq_codes = pd.factorize(events_cleaned["Code"].astype(str))
+        goal_code = np.array([any(k in c.lower() for k in GOAL_CODE_KEYWORDS) for c in uniq_codes], dtype=bool)
+        is_goal_code = goal_code[code_idx]
 
         # Find a usable team column
         team_col = None
@@ -339,42 +377,45 @@ def compute_risk_score(events_df: pd.DataFrame, config: RiskConfig = RiskConfig(
                 break
 
         if team_col is not None and is_goal_code.any():
-            teams = events_cleaned[team_col].astype(str).str.lower().str.strip()
-
-            is_known_team = (teams != "") & (teams != "n/a") & (teams != "na") & (teams != "none")
-            is_barca_team = teams.isin(BARCA_NAMES)
-
-            # Only spike opponent goals (goals conceded by Barça)
-            is_opponent_goal = is_goal_code & is_known_team & (~is_barca_team)
+            team_idx, uniq_teams = pd.factorize(events_cleaned[team_col].astype(str))
+            # Only spike opponent goals (goals conceded by Barça): known team, not Barça
+            opp_team = np.array(
+                [t.lower().strip() not in ("", "n/a", "na", "none", *BARCA_NAMES) for t in uniq_teams],
+                dtype=bool,
+            )
+            is_opponent_goal = is_goal_code & opp_team[team_idx]
 
             if is_opponent_goal.any():
-                g_start = pd.to_numeric(events_cleaned.loc[is_opponent_goal, "Start"], errors="coerce")
-                g_end   = pd.to_numeric(events_cleaned.loc[is_opponent_goal, "End"], errors="coerce")
+                g_start = pd.to_numeric(events_cleaned["Start"], errors="coerce").to_numpy()[is_opponent_goal]
+                g_end = pd.to_numeric(events_cleaned["End"], errors="coerce").to_numpy()[is_opponent_goal]
+                g_mid = (g_start + g_end) / 2
 
                 # Prefer End (often closer to the actual goal moment), else midpoint, else Start
                 goal_times = np.where(
-                    np.isfinite(g_end.to_numpy()),
-                    g_end.to_numpy(),
-                    np.where(
-                        np.isfinite(((g_start + g_end) / 2).to_numpy()),
-                        ((g_start + g_end) / 2).to_numpy(),
-                        g_start.to_numpy()
-                    )
+                    np.isfinite(g_end),
+                    g_end,
+                    np.where(np.isfinite(g_mid), g_mid, g_start),
                 )
 
-                for gt in goal_times:
-                    if not np.isfinite(gt):
-                        continue
-                    mask = np.abs(time_grid - float(gt)) <= GOAL_SPIKE_RADIUS_S
-                    if not mask.any():
-                        continue
+                # Grid index range within +/- radius of every goal (grid is sorted)
+                goal_times = goal_times[np.isfinite(goal_times)]
+                lo = np.searchsorted(time_grid, goal_times - GOAL_SPIKE_RADIUS_S, side="left")
+                hi = np.searchsorted(time_grid, goal_times + GOAL_SPIKE_RADIUS_S, side="right")
+
+                # How many goal windows cover each grid point
+                cover = np.zeros(len(time_grid) + 1, dtype=int)
+                np.add.at(cover, lo, 1)
+                np.add.at(cover, hi, -1)
+                cover = np.cumsum(cover[:-1])
+                mask = cover > 0
 
+                if mask.any():
                     scaled[mask] = config.clamp_max  # force 100 for conceded goals
                     raw_smooth[mask] = np.maximum(raw_smooth[mask], abs_max)
 
-                    idxs = np.where(mask)[0]
-                    for i in idxs:
-                        active_events[i].append("GOAL_CONCEDED")
+                    # active lists are shared between grid points: copy, don't append in place
+                    for i in np.flatnonzero(mask):
+                        active_events[i] = active_events[i] + ["GOAL_CONCEDED"] * int(cover[i])
 
     out = pd.DataFrame(
         {
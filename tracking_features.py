@@ -27,7 +27,7 @@ DEFAULT_COLS = TrackingCols()
 def _slice_window(df: pd.DataFrame, t0: float, t1: float, time_col: str) -> pd.DataFrame:
     if df is None or df.empty:
         return df
-    return df[(df[time_col] >= t0) & (df[time_col] <= t1)].copy()
+    return df[(df[time_col] >= t0) & (df[time_col] <= t1)]
 
 
 def _team_frame(players_t: pd.DataFrame, team_value: str, team_col: str) -> pd.DataFrame:
@@ -35,7 +35,7 @@ def _team_frame(players_t: pd.DataFrame, team_value: str, team_col: str) -> pd.D
         return players_t
     # team_id might be numeric or string or NaN
     s = players_t[team_col].astype(str)
-    return players_t[s == str(team_value)].copy()
+    return players_t[s == str(team_value)]
 
 
 def _shape_metrics(team_df: pd.DataFrame, x_col: str, y_col: str) -> Dict[str, float]:
@@ -146,9 +146,8 @@ def summarize_window(
         out["tracking_coverage_warning"] = True
         return out
 
-    pw = pw_raw.copy()
-    pw[tc] = pd.to_numeric(pw[tc], errors="coerce")
-    pw = pw.dropna(subset=[tc])
+    # Boolean-indexed frames are independent under pandas copy-on-write, no .copy() needed
+    pw = pw_raw.assign(**{tc: pd.to_numeric(pw_raw[tc], errors="coerce")}).dropna(subset=[tc])
 
     if pw.empty:
         out["error"] = "no numeric time_s in window"
@@ -161,15 +160,16 @@ def summarize_window(
     idx = int(np.nanargmin(np.abs(t_vals - float(t_target))))
     t_snap = float(t_vals[idx])
 
-    pw = pw[pw[tc] == t_snap].copy()
+    pw = pw[pw[tc] == t_snap]
     out["window"]["snap_s"] = float(t_snap)
 
     # Reduce to one row per (team, player)
-    pw[cols.x_col] = pd.to_numeric(pw[cols.x_col], errors="coerce")
-    pw[cols.y_col] = pd.to_numeric(pw[cols.y_col], errors="coerce")
-
     pw = (
-        pw.dropna(subset=[cols.team_col, cols.player_col, cols.x_col, cols.y_col])
+        pw.assign(**{
+            cols.x_col: pd.to_numeric(pw[cols.x_col], errors="coerce"),
+            cols.y_col: pd.to_numeric(pw[cols.y_col], errors="coerce"),
+        })
+          .dropna(subset=[cols.team_col, cols.player_col, cols.x_col, cols.y_col])
           .astype({cols.team_col: "string", cols.player_col: "string"})
           .groupby([cols.team_col, cols.player_col], as_index=False)[[cols.x_col, cols.y_col]].median()
     )